@@ -1,20 +1,86 @@
 #!/usr/bin/env python3
 
+import asyncio
+import codecs
 import logging
+import requests
+import selectors
 import subprocess
 import shutil
 import sys
+import tempfile
+import threading
 import os
 
-# Terminal formatting
+from requests.adapters import HTTPAdapter, Retry
+
+# Terminal formatting, shared by every module
 BOLD = "\033[1m"
 RED = "\033[31m"
 GREEN = "\033[32m"
 YELLOW = "\033[33m"
+BLUE = "\033[34m"
+MAGENTA = "\033[35m"
+CYAN = "\033[36m"
 ENDC = '\033[0m'
 
 HOME_DIR = os.path.expanduser("~")
 SSH_KEY = f"{HOME_DIR}/.ssh/linux-kernel-vscode-rsa"
+CMD_TIMEOUT = 3600
+FETCH_RETRIES = 3
+# Multiplex every ssh/scp call to the VM over one persistent master
+# connection, so only the first call pays the handshake and auth cost.
+# Compression is disabled as the VM is reached over loopback.
+SSH_OPTS = [
+    "-o", "IdentitiesOnly=yes",
+    "-o", "NoHostAuthenticationForLocalhost=yes",
+    "-o", "ControlMaster=auto",
+    "-o", f"ControlPath={tempfile.gettempdir()}/syz-ssh-%r@%h:%p",
+    "-o", "ControlPersist=60s",
+    "-o", "BatchMode=yes",
+    "-o", "Compression=no",
+]
+# Pre-built color-wrapped messages for the hot command paths, so the
+# wrapping f-strings are evaluated once at import time
+ERR_CMD_TIMEOUT = f"{RED}Command has exceeded the time limit!{ENDC}"
+ERR_GIT_VERSION = f"{RED}git version check failed!{ENDC}"
+ERR_GIT_MISSING = f"{RED}git command not available!{ENDC}"
+ERR_CLONE = f"{RED}Repository clone failed!{ENDC}"
+ERR_RM = f"{RED}rm -rf failed!{ENDC}"
+ERR_DELETION = f"{RED}Deletion failed!{ENDC}"
+ERR_REMOTE_ADD = f"{RED}Adding new remote failed!{ENDC}"
+ERR_REMOTE_FETCH = f"{RED}New remote fetch failed!{ENDC}"
+ERR_REMOTE_CHECK = f"{RED}Remote check failed!{ENDC}"
+ERR_SSH_KEY = f"{RED}SSH key doesn't exist!{ENDC}"
+ERR_SSH_CMD = f"{RED}Running ssh cmd failed!{ENDC}"
+WARN_REPO_MISSING = f"{YELLOW}Repository doesn't exist!{ENDC}"
+# Set SYZ_PROBE_CACHE=0 to re-run idempotent probes on every call
+PROBE_CACHE = os.environ.get("SYZ_PROBE_CACHE", "1") != "0"
+
+
+class GitCommandError(Exception):
+    """
+    Raised when a command run through _run_or_raise returns non-zero.
+    """
+    def __init__(self, err_msg, returncode, stderr="") -> None:
+        super().__init__(err_msg)
+        self.returncode = returncode
+        self.stderr = stderr
+
+
+class _LazyCmd:
+    """
+    Defer joining an argv list for debug logging.
+
+    The join only runs when the record is actually emitted, so the
+    default INFO level pays no string allocation per command.
+    """
+    def __init__(self, cmd) -> None:
+        self.cmd = cmd
+
+    def __str__(self) -> str:
+        # argv entries may be path-like, not just str
+        return " ".join(map(str, self.cmd))
 
 
 class SyzCommon:
@@ -22,7 +88,7 @@ class SyzCommon:
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.INFO)
 
-    def run_cmd(self, cmd, err_msg, dump_std=False):
+    def run_cmd(self, cmd, err_msg, dump_std=False, cwd=None):
         """
         Execute a command in the system shell.
 
@@ -32,6 +98,8 @@ class SyzCommon:
                                 command fails.
             dump_std (bool):    The flag indicates if stdout of the command
                                 should be dumped to the variables
+            cwd (str):          Working directory for the command; the
+                                interpreter's own cwd is never changed.
 
         Returns:
         bool:              True if the command execution is successful (return
@@ -39,24 +107,292 @@ class SyzCommon:
         self.output (str): Standard output of the command.
         """
         self.stdout = ""
+        # Reusing one environment copy and keeping the spawn flags on
+        # their cheap settings lets CPython take the posix_spawn fast
+        # path instead of fork+exec for every short probe
+        if not hasattr(self, "_cached_env"):
+            self._cached_env = os.environ.copy()
         if not dump_std:
-            p = subprocess.Popen(cmd, stdout=sys.stdout, stderr=sys.stderr)
-            p.wait()
+            self.returncode = asyncio.run_coroutine_threadsafe(
+                self._stream_cmd(cmd, cwd=cwd), self._get_loop()
+            ).result()
         else:
             p = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
+                stderr=subprocess.PIPE,
+                close_fds=False,
+                restore_signals=False,
+                start_new_session=False,
+                env=self._cached_env,
+                cwd=cwd
             )
-            stdout, stderr = p.communicate()
-            self.stdout = stdout.decode("utf-8")
-            self.stderr = stderr.decode("utf-8")
+            self.stdout, self.stderr = self._drain_std(p)
+            p.wait()
+            self.returncode = p.returncode
 
-        if p.returncode != 0:
+        if self.returncode != 0:
+            self.logger.error(err_msg)
+            return False
+        return True
+
+    def _get_session(self):
+        """
+        Return the shared HTTP session, creating it lazily.
+
+        One keep-alive pool serves all syzkaller fetches, so repeated
+        downloads reuse the TCP/TLS connection instead of paying the
+        handshake per request.
+
+        Returns:
+            session (requests.Session): The shared pooled session.
+        """
+        if not hasattr(self, "_session"):
+            session = requests.Session()
+            # requests/urllib3 speak HTTP/1.1 only, which is what the
+            # parallel fetch path wants: throughput scales with the pool
+            # size instead of multiplexing onto one HTTP/2 connection.
+            # Keep it that way if this ever moves to httpx (http2=False)
+            adapter = HTTPAdapter(
+                pool_connections=8,
+                pool_maxsize=16,
+                max_retries=Retry(total=3, backoff_factor=0.3)
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+        return self._session
+
+    def _err(self, msg):
+        """
+        Log a red error message with lazy color wrapping.
+
+        The ANSI codes are passed as format arguments, so no colored
+        string is built unless a handler actually emits the record.
+
+        Args:
+            msg (str): The message text, without color codes.
+        """
+        self.logger.error("%s%s%s", RED, msg, ENDC)
+
+    def fetch_to_file(self, uri, dest, err_msg):
+        """
+        Download a URI into a local file over the pooled HTTP session.
+
+        Replaces per-download curl subprocesses: connections to the same
+        host stay alive between downloads and no process is spawned per
+        transfer.
+
+        Args:
+            uri (str):      The URI to download.
+            dest (str):     Path of the file to write.
+            err_msg (str):  The error message to be logged if the
+                            download fails.
+
+        Returns:
+            bool: True if the download succeeded, False otherwise.
+        """
+        self.logger.debug("GET %s -> %s", uri, dest)
+        try:
+            with self._get_session().get(uri, stream=True,
+                                         timeout=60) as response:
+                response.raise_for_status()
+                with open(dest, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        f.write(chunk)
+        except (requests.RequestException, OSError) as err:
+            self.logger.error(err)
             self.logger.error(err_msg)
             return False
         return True
 
+    def _get_loop(self):
+        """
+        Return the shared background event loop, starting it lazily.
+
+        One loop in a daemon thread serves every streamed command for the
+        lifetime of the instance, so concurrent commands can stream to
+        the terminal without creating a loop (or a thread) per call.
+
+        Returns:
+            loop (AbstractEventLoop): The running background event loop.
+        """
+        if not hasattr(self, "_loop"):
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever, daemon=True
+            )
+            self._loop_thread.start()
+        return self._loop
+
+    async def _stream_cmd(self, cmd, cwd=None):
+        """
+        Run a command, streaming its output to the terminal.
+
+        Args:
+            cmd (list): The command to be executed.
+            cwd (str):  Working directory for the command.
+
+        Returns:
+            returncode (int): Return code of the command.
+        """
+        async def _copy(stream, out):
+            # Fixed-size reads instead of line iteration: readline()
+            # raises ValueError once a line exceeds the reader's 64 KiB
+            # limit, and command output has no line-length guarantee
+            while chunk := await stream.read(65536):
+                out.write(chunk)
+                out.flush()
+
+        p = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd
+        )
+        await asyncio.gather(
+            _copy(p.stdout, sys.stdout.buffer),
+            _copy(p.stderr, sys.stderr.buffer)
+        )
+        return await p.wait()
+
+    def _run_or_raise(self, cmd, err_msg, dump_std=False):
+        """
+        Execute a command and raise on failure.
+
+        Internal callers chain several commands; raising keeps each call
+        site to one line and lets retry logic wrap the whole sequence
+        instead of threading bool returns through every branch.
+
+        Args:
+            cmd (list):      The command to be executed.
+            err_msg (str):   The error message to be logged if the command
+                             fails.
+            dump_std (bool): The flag indicates if stdout of the command
+                             should be dumped to the variables
+
+        Returns:
+            stdout (str): Standard output of the command (empty unless
+                          dump_std is set).
+
+        Raises:
+            GitCommandError: If the command returns a non-zero code.
+        """
+        if not self.run_cmd(cmd, err_msg, dump_std=dump_std):
+            raise GitCommandError(err_msg, self.returncode,
+                                  getattr(self, "stderr", ""))
+        return self.stdout
+
+    def _drain_std(self, p):
+        """
+        Drain stdout and stderr of a running process incrementally.
+
+        Unlike communicate(), the output is decoded chunk by chunk and
+        joined once, so the full bytes blob and its str copy never exist
+        at the same time even for noisy commands.
+
+        Args:
+            p (Popen): A process with stdout and stderr pipes.
+
+        Returns:
+            tuple: (stdout, stderr) decoded output of the process.
+        """
+        parts = {p.stdout: [], p.stderr: []}
+        decoders = {
+            p.stdout: codecs.getincrementaldecoder("utf-8")(),
+            p.stderr: codecs.getincrementaldecoder("utf-8")(),
+        }
+        sel = selectors.DefaultSelector()
+        sel.register(p.stdout, selectors.EVENT_READ)
+        sel.register(p.stderr, selectors.EVENT_READ)
+        while sel.get_map():
+            for key, _ in sel.select():
+                chunk = os.read(key.fd, 65536)
+                if not chunk:
+                    sel.unregister(key.fileobj)
+                    continue
+                parts[key.fileobj].append(
+                    decoders[key.fileobj].decode(chunk)
+                )
+        sel.close()
+        return "".join(parts[p.stdout]), "".join(parts[p.stderr])
+
+    async def _run_cmd_async(self, cmd, err_msg, dump_std=False,
+                             timeout=CMD_TIMEOUT):
+        """
+        Execute a command asynchronously in the system shell.
+
+        Args:
+            cmd (list):         The command to be executed.
+            err_msg (str):      The error message to be logged if the
+                                command fails.
+            dump_std (bool):    The flag indicates if stdout of the command
+                                should be dumped to the returned tuple
+            timeout (int):      Time limit in seconds after which the command
+                                is killed
+
+        Returns:
+            tuple: (status, stdout, stderr) where status is True if the
+                   command execution is successful (return code 0), False
+                   otherwise, and stdout/stderr hold the command output
+                   when dump_std is set.
+        """
+        stdout = ""
+        stderr = ""
+        if not dump_std:
+            p = await asyncio.create_subprocess_exec(*cmd)
+            try:
+                await asyncio.wait_for(p.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                p.kill()
+                self.logger.error(ERR_CMD_TIMEOUT)
+                return False, stdout, stderr
+        else:
+            p = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            try:
+                out, err = await asyncio.wait_for(p.communicate(),
+                                                  timeout=timeout)
+            except asyncio.TimeoutError:
+                p.kill()
+                self.logger.error(ERR_CMD_TIMEOUT)
+                return False, stdout, stderr
+            stdout = out.decode("utf-8")
+            stderr = err.decode("utf-8")
+
+        if p.returncode != 0:
+            self.logger.error(err_msg)
+            return False, stdout, stderr
+        return True, stdout, stderr
+
+    def run_many(self, cmds):
+        """
+        Execute multiple commands concurrently.
+
+        Network-bound commands (e.g. git clone/fetch of several trees)
+        overlap their latency instead of serializing.
+
+        Args:
+            cmds (list): A list of (cmd, err_msg) or (cmd, err_msg, dump_std)
+                         tuples, each executed as one command.
+
+        Returns:
+            statuses (list): A list of booleans, one per command, True if
+                             the command execution was successful.
+        """
+        async def _gather_cmds():
+            return await asyncio.gather(
+                *[self._run_cmd_async(*cmd) for cmd in cmds]
+            )
+
+        results = asyncio.run_coroutine_threadsafe(
+            _gather_cmds(), self._get_loop()
+        ).result()
+        return [status for status, _, _ in results]
+
     def check_git_version(self, dry_run=False):
         """
         Check if git is installed.
@@ -69,52 +405,92 @@ class SyzCommon:
                            was successful returns True, if not it returns False
         """
         cmd_version = ["git", "--version"]
-        self.logger.debug("CMD: " + " ".join(cmd_version))
+        self.logger.debug("CMD: %s", _LazyCmd(cmd_version))
 
         if dry_run:
             return True
 
+        # The installed git version cannot change within one run, so one
+        # probe per process is enough
+        if PROBE_CACHE and hasattr(self, "_git_version_probe"):
+            status, self.stdout = self._git_version_probe
+            return status
+
         try:
             if not self.run_cmd(cmd_version,
-                                f"{RED}git version check failed!{ENDC}",
+                                ERR_GIT_VERSION,
                                 dump_std=True):
+                self._git_version_probe = (False, self.stdout)
                 return False
             if self.stdout:
                 self.logger.debug(self.stdout)
             else:
+                self._git_version_probe = (False, self.stdout)
                 return False
         except FileNotFoundError:
-            self.logger.error(f"{RED}git command not available!{ENDC}")
+            self.logger.error(ERR_GIT_MISSING)
             return False
 
+        self._git_version_probe = (True, self.stdout)
         return True
 
-    def clone_repository(self, repo, branch=None, dry_run=False):
+    def clone_repository(self, repo, branch=None, depth=None, blobless=False,
+                         reference=None, dissociate=True, dry_run=False):
         """
         Clone git repository.
 
+        For triage a full history is rarely needed. A shallow (depth) or
+        blobless (partial) clone moves a fraction of the bytes of a full
+        kernel clone over the network and on disk, and a reference clone
+        borrows the objects an earlier local clone already holds.
+
         Args:
-            repo (str):     A repository to be cloned
+            repo (str or list): A repository to be cloned or a list of
+                                repositories to be cloned concurrently
             branch (str):   A branch to be checkout
+            depth (int):    If set, create a shallow single-branch clone
+                            truncated to the given number of commits
+            blobless (bool): If flag is true clone with --filter=blob:none
+                            so blobs are fetched on demand
+            reference (str): Path of a local repository whose objects are
+                            reused instead of being downloaded again
+            dissociate (bool): If flag is true the reference clone copies
+                            the borrowed objects so it does not depend on
+                            the reference repository afterwards
             dry_run (bool): If flag is true method does not execute commands
 
         Returns:
             status (bool): Return status based on return code. If clone was
                            successful returns True, if not it returns False
         """
-        cmd_clone = ["git", "clone", repo]
-        if branch:
-            cmd_clone.append("-b")
-            cmd_clone.append(branch)
-        self.logger.debug("CMD: " + " ".join(cmd_clone))
+        repos = repo if isinstance(repo, list) else [repo]
+        cmds_clone = []
+        for repo_uri in repos:
+            cmd_clone = ["git", "clone", repo_uri]
+            if branch:
+                cmd_clone.append("-b")
+                cmd_clone.append(branch)
+            if depth:
+                cmd_clone += ["--depth", str(depth), "--single-branch"]
+            if blobless:
+                cmd_clone.append("--filter=blob:none")
+            if depth or blobless:
+                cmd_clone.append("--no-tags")
+            if reference:
+                cmd_clone += ["--reference-if-able", reference]
+                if dissociate:
+                    cmd_clone.append("--dissociate")
+            self.logger.debug("CMD: %s", _LazyCmd(cmd_clone))
+            cmds_clone.append((cmd_clone,
+                               ERR_CLONE))
 
         if dry_run:
             return True
 
-        # Run "git clone command"
-        if not self.run_cmd(cmd_clone, f"{RED}Repository clone failed!{ENDC}"):
-            return False
-        return True
+        # Run "git clone" commands, concurrently if more than one
+        if len(cmds_clone) == 1:
+            return self.run_cmd(*cmds_clone[0])
+        return all(self.run_many(cmds_clone))
 
     def remove_repository(self, repo_path, dry_run=False):
         """
@@ -130,18 +506,29 @@ class SyzCommon:
                            repository was successful returns True, if not it
                            returns False
         """
+        cmd_remove = ["rm", "-rf", "--", repo_path]
+        self.logger.debug("CMD: %s", _LazyCmd(cmd_remove))
+
         if dry_run:
             return True
 
         if not os.path.exists(repo_path):
-            self.logger.warning(f"{YELLOW}Repository doesn't exist!{ENDC}")
+            self.logger.warning(WARN_REPO_MISSING)
             return True
 
-        shutil.rmtree(repo_path, ignore_errors=True)
+        # rm walks a kernel-sized clone much faster than a Python
+        # shutil.rmtree loop; keep the latter as a fallback
+        try:
+            self.run_cmd(cmd_remove, ERR_RM)
+        except FileNotFoundError:
+            shutil.rmtree(repo_path, ignore_errors=True)
         if os.path.exists(repo_path):
-            self.logger.error(f"{RED}Deletion failed!{ENDC}")
+            shutil.rmtree(repo_path, ignore_errors=True)
+        if os.path.exists(repo_path):
+            self.logger.error(ERR_DELETION)
             return False
 
+        self._drop_repo_remotes_cache(repo_path)
         self.logger.debug(f"{repo_path} deleted successfully")
         return True
 
@@ -159,33 +546,23 @@ class SyzCommon:
                            checkout was successful returns True, if not it
                            returns False
         """
-        cmd_checkout = ["git", "checkout", branch]
+        cmd_checkout = ["git", "-C", repo_path, "checkout", branch]
         err_msg = "doesn't exist in the repository."
-        self.logger.debug("CMD: " + " ".join(cmd_checkout))
+        self.logger.debug("CMD: %s", _LazyCmd(cmd_checkout))
 
         if dry_run:
             return True
 
-        workspace_dir = os.getcwd()
-        if not os.path.exists(repo_path):
-            self.logger.error(f"{RED}Repository doesn't exist!{ENDC}")
-            return False
-
-        self.logger.debug(f"CMD: cd {repo_path}")
-        os.chdir(repo_path)
-
-        if not self.run_cmd(cmd_checkout,
-                            f"{RED}{branch} {err_msg}!{ENDC}"):
-            os.chdir(workspace_dir)
+        try:
+            self._run_or_raise(cmd_checkout,
+                               f"{RED}{branch} {err_msg}!{ENDC}")
+        except GitCommandError:
             return False
 
-        self.logger.debug(f"CMD: cd {workspace_dir}")
-        os.chdir(workspace_dir)
-
         return True
 
     def add_repository_remote(self, repo_path, remote_uri, remote_name,
-                              dry_run=False):
+                              auto_fetch=True, dry_run=False):
         """
         Check if git add new repository remote.
 
@@ -194,6 +571,9 @@ class SyzCommon:
                                remote will be added
             remote_uri (str):  A remote uri to be added
             remote_name (str): Name of the new remote
+            auto_fetch (bool): If flag is true the new remote is fetched in
+                               the same git invocation (git remote add -f),
+                               saving a separate fetch process
             dry_run (bool): If flag is true method does not execute commands
 
         Returns:
@@ -201,38 +581,44 @@ class SyzCommon:
                            remote was successful returns True, if not it
                            returns False
         """
-        cmd_remote_add = ["git", "remote", "add", remote_name, remote_uri]
-        self.logger.debug("CMD: " + " ".join(cmd_remote_add))
+        cmd_remote_add = ["git", "-C", repo_path, "remote", "add"]
+        if auto_fetch:
+            cmd_remote_add.append("-f")
+        cmd_remote_add += [remote_name, remote_uri]
+        self.logger.debug("CMD: %s", _LazyCmd(cmd_remote_add))
 
         if dry_run:
             return True
 
-        workspace_dir = os.getcwd()
-        if not os.path.exists(repo_path):
-            self.logger.error(f"{RED}Repository doesn't exist!{ENDC}")
-            return False
-
-        self.logger.debug(f"CMD: cd {repo_path}")
-        os.chdir(repo_path)
-
-        if not self.run_cmd(cmd_remote_add,
-                            f"{RED}Adding new remote failed!{ENDC}"):
-            os.chdir(workspace_dir)
+        try:
+            self._run_or_raise(cmd_remote_add,
+                               ERR_REMOTE_ADD)
+        except GitCommandError:
             return False
 
-        self.logger.debug(f"CMD: cd {workspace_dir}")
-        os.chdir(workspace_dir)
-
+        self._drop_repo_remotes_cache(repo_path)
         return True
 
-    def fetch_repository_remote(self, repo_path, remote_name, dry_run=False):
+    def fetch_repository_remote(self, repo_path, remote_name, depth=None,
+                                since=None, filter_spec=None, dry_run=False):
         """
         Fetch existing repository remote.
 
+        A full fetch of a kernel-scale remote moves gigabytes of history;
+        triage usually only needs the tip or a narrow commit range, so the
+        fetch can be truncated by depth, date or an object filter.
+
         Args:
             repo_path (str):    A repository relative directory where a new
                                remote will be added
-            remote_name (str): Name of the new remote
+            remote_name (str or list): Name of the remote to fetch or a list
+                               of remotes to be fetched concurrently
+            depth (int):    If set, deepen the fetch to the given number of
+                            commits only
+            since (str):    If set, fetch commits newer than the given date
+                            (git --shallow-since)
+            filter_spec (str): If set, apply the given partial-clone filter
+                            (e.g. "blob:none")
             dry_run (bool): If flag is true method does not execute commands
 
         Returns:
@@ -240,29 +626,95 @@ class SyzCommon:
                            remote was successful returns True, if not it
                            returns False
         """
-        cmd_fetch_remote = ["git", "fetch", remote_name]
-        self.logger.debug("CMD: " + " ".join(cmd_fetch_remote))
+        remote_names = (remote_name if isinstance(remote_name, list)
+                        else [remote_name])
+        shallow_args = []
+        if depth:
+            shallow_args += ["--depth", str(depth)]
+        if since:
+            shallow_args.append(f"--shallow-since={since}")
+        if filter_spec:
+            shallow_args.append(f"--filter={filter_spec}")
+        if shallow_args:
+            shallow_args.append("--no-tags")
+        cmds_fetch_remote = []
+        for name in remote_names:
+            cmd_fetch_remote = (["git", "-C", repo_path, "fetch", name]
+                                + shallow_args)
+            self.logger.debug("CMD: %s", _LazyCmd(cmd_fetch_remote))
+            cmds_fetch_remote.append((cmd_fetch_remote,
+                                      ERR_REMOTE_FETCH))
 
         if dry_run:
             return True
 
-        workspace_dir = os.getcwd()
-        if not os.path.exists(repo_path):
-            self.logger.error(f"{RED}Repository doesn't exist!{ENDC}")
-            return False
+        # Run "git fetch" commands, concurrently if more than one
+        if len(cmds_fetch_remote) > 1:
+            return all(self.run_many(cmds_fetch_remote))
+
+        # Fetches fail transiently on flaky links; retry a few times
+        cmd_fetch, err_fetch = cmds_fetch_remote[0]
+        for attempt in range(FETCH_RETRIES):
+            try:
+                self._run_or_raise(cmd_fetch, err_fetch)
+                return True
+            except GitCommandError:
+                if attempt + 1 < FETCH_RETRIES:
+                    self.logger.warning(f"{YELLOW}Retrying fetch "
+                                        f"({attempt + 2}/{FETCH_RETRIES})"
+                                        f"{ENDC}")
+        return False
 
-        self.logger.debug(f"CMD: cd {repo_path}")
-        os.chdir(repo_path)
+    def _get_repo_remotes(self, repo_path):
+        """
+        List the remotes of a repository, caching the parsed output.
 
-        if not self.run_cmd(cmd_fetch_remote,
-                            f"{RED}New remote fetch failed!{ENDC}"):
-            os.chdir(workspace_dir)
-            return False
+        Every probe otherwise costs a fresh fork+exec of git; the remote
+        listing only changes when this process adds a remote, so one
+        spawn per repository is enough and later probes are dict lookups.
 
-        self.logger.debug(f"CMD: cd {workspace_dir}")
-        os.chdir(workspace_dir)
+        Parameters:
+        repo_path (str): The path to the local Git repository.
 
-        return True
+        Returns:
+        dict or None: Mapping of remote name to remote uri, or None if
+                      listing the remotes failed.
+        """
+        if not hasattr(self, "_remotes"):
+            self._remotes = {}
+        if PROBE_CACHE and repo_path in self._remotes:
+            return self._remotes[repo_path]
+
+        cmd_remote_list = ["git", "-C", repo_path, "remote", "-v"]
+        self.logger.debug("CMD: %s", _LazyCmd(cmd_remote_list))
+
+        if not self.run_cmd(cmd_remote_list,
+                            ERR_REMOTE_CHECK,
+                            dump_std=True):
+            return None
+
+        # Each remote is listed twice (fetch and push); partition carves
+        # out name and uri without building a per-line split list and
+        # setdefault keeps the first of the two entries
+        remotes = {}
+        for line in self.stdout.split("\n"):
+            name, tab, rest = line.partition("\t")
+            if not tab:
+                continue
+            uri, _, _ = rest.partition(" ")
+            remotes.setdefault(name, uri)
+        self._remotes[repo_path] = remotes
+        return remotes
+
+    def _drop_repo_remotes_cache(self, repo_path):
+        """
+        Drop the cached remote listing of a repository.
+
+        Parameters:
+        repo_path (str): The path to the local Git repository.
+        """
+        if hasattr(self, "_remotes"):
+            self._remotes.pop(repo_path, None)
 
     def check_repository_remote(self, repo_path, repo_name, dry_run=False):
         """
@@ -281,41 +733,43 @@ class SyzCommon:
 
         Logging:
         - Logs debug information about the commands being executed.
-        - Logs an error if the repository path does not exist.
+        - Logs an error if listing the repository remotes fails.
         """
-        cmd_remote_list = ["git", "remote", "-v"]
-        self.logger.debug("CMD: " + " ".join(cmd_remote_list))
         self.remote_name = None
 
         if dry_run:
             self.remote_name = "dry run"
             return True
 
-        workspace_dir = os.getcwd()
-        if not os.path.exists(repo_path):
-            self.logger.error(f"{RED}Repository doesn't exist!{ENDC}")
+        remotes = self._get_repo_remotes(repo_path)
+        if remotes is None:
             return False
 
-        self.logger.debug(f"CMD: cd {repo_path}")
-        os.chdir(repo_path)
-
-        if not self.run_cmd(cmd_remote_list,
-                            f"{RED}Remote check failed!{ENDC}",
-                            dump_std=True):
-            os.chdir(workspace_dir)
-            return False
-
-        for line in self.stdout.splitlines():
-            line_list = line.split("\t")
-            if repo_name in line_list[1]:
-                self.remote_name = line_list[0]
-                break
-        os.chdir(workspace_dir)
+        self.remote_name = next(
+            (name for name, uri in remotes.items() if repo_name in uri),
+            None
+        )
 
         if self.remote_name:
             return True
         return False
 
+    def _check_ssh_key(self):
+        """
+        Check once per session that the VM SSH key exists.
+
+        The key cannot appear or vanish mid-run, so one stat() serves
+        every later ssh/scp/rsync call.
+
+        Returns:
+        bool: True if the SSH key exists, False otherwise.
+        """
+        if not hasattr(self, "_ssh_key_ok"):
+            self._ssh_key_ok = os.path.exists(SSH_KEY)
+        if not self._ssh_key_ok:
+            self.logger.error(ERR_SSH_KEY)
+        return self._ssh_key_ok
+
     def send_file_to_vm(self, file, dry_run=False):
         """
         Sends a file to a virtual machine using SCP (Secure Copy Protocol).
@@ -333,17 +787,14 @@ class SyzCommon:
         - This method assumes `SSH_KEY` is a predefined constant representing
           the path to the SSH key file.
         """
-        scp_cmd = ["scp", "-P", "5555", "-r", "-i", SSH_KEY, "-o",
-                   "IdentitiesOnly=yes", "-o",
-                   "NoHostAuthenticationForLocalhost=yes", file,
-                   "root@localhost:/root"]
-        self.logger.debug("CMD: " + " ".join(scp_cmd))
+        scp_cmd = (["scp", "-P", "5555", "-r", "-i", SSH_KEY] + SSH_OPTS
+                   + [file, "root@localhost:/root"])
+        self.logger.debug("CMD: %s", _LazyCmd(scp_cmd))
 
         if dry_run:
             return True
 
-        if not os.path.exists(SSH_KEY):
-            self.logger.error(f"{RED}SSH key doesn't exist!{ENDC}")
+        if not self._check_ssh_key():
             return False
 
         if not os.path.exists(file):
@@ -355,6 +806,46 @@ class SyzCommon:
             return False
         return True
 
+    def send_file_to_vm_rsync(self, file, dry_run=False):
+        """
+        Sends a file to a virtual machine using rsync over SSH.
+
+        Unlike scp, rsync only transfers blocks that changed, so
+        repeatedly pushing an updated artifact costs almost no bandwidth.
+
+        Parameters:
+        file (str): The path to the file to be sent to the VM.
+        dry_run (bool): If True, simulates the file transfer without making
+                        any changes (default is False).
+
+        Returns:
+        bool: True if the file transfer is successful or if dry_run is True,
+              False otherwise.
+
+        Note:
+        - This method assumes `SSH_KEY` is a predefined constant representing
+          the path to the SSH key file.
+        """
+        ssh_tunnel = " ".join(["ssh", "-p", "5555", "-i", SSH_KEY] + SSH_OPTS)
+        rsync_cmd = ["rsync", "-az", "--inplace", "--partial",
+                     "-e", ssh_tunnel, file, "root@localhost:/root/"]
+        self.logger.debug("CMD: %s", _LazyCmd(rsync_cmd))
+
+        if dry_run:
+            return True
+
+        if not self._check_ssh_key():
+            return False
+
+        if not os.path.exists(file):
+            self.logger.error(f"{RED}{file} doesn't exist!{ENDC}")
+            return False
+
+        if not self.run_cmd(rsync_cmd,
+                            f"{RED}Syncing {file} file to vm failed!{ENDC}"):
+            return False
+        return True
+
     def run_vm_command(self, vm_cmd, dry_run=False):
         """
         Runs a specified command on a virtual machine via SSH.
@@ -373,20 +864,56 @@ class SyzCommon:
         - This method assumes `SSH_KEY` is a predefined constant representing
           the path to the SSH key file.
         """
-        ssh_cmd = ["ssh", "-p", "5555", "-i", SSH_KEY, "-o",
-                   "IdentitiesOnly=yes", "-o",
-                   "NoHostAuthenticationForLocalhost=yes",
-                   "root@localhost"] + vm_cmd
-        self.logger.debug("CMD: " + " ".join(ssh_cmd))
+        ssh_cmd = (["ssh", "-p", "5555", "-i", SSH_KEY] + SSH_OPTS
+                   + ["root@localhost"] + vm_cmd)
+        self.logger.debug("CMD: %s", _LazyCmd(ssh_cmd))
 
         if dry_run:
             return True
 
-        if not os.path.exists(SSH_KEY):
-            self.logger.error(f"{RED}SSH key doesn't exist!{ENDC}")
+        if not self._check_ssh_key():
             return False
 
         if not self.run_cmd(ssh_cmd,
-                            f"{RED}Running ssh cmd failed!{ENDC}"):
+                            ERR_SSH_CMD):
+            return False
+        return True
+
+    def close_vm_connection(self, dry_run=False):
+        """
+        Close the persistent SSH master connection to the VM.
+
+        The master would otherwise linger for ControlPersist seconds;
+        call this on teardown once the VM is gone.
+
+        Parameters:
+        dry_run (bool): If True, simulates closing the connection without
+                        making any changes (default is False).
+
+        Returns:
+        bool: True if the master connection was closed or none was open
+              or if dry_run is True, False otherwise.
+        """
+        if dry_run:
+            return True
+
+        # ssh -O exit fails loudly when no master is running; checking
+        # the expanded ControlPath socket first keeps clean runs (and
+        # cold boots) free of teardown noise
+        socket_path = (f"{tempfile.gettempdir()}/"
+                       "syz-ssh-root@localhost:5555")
+        if not os.path.exists(socket_path):
+            return True
+
+        ssh_cmd = (["ssh", "-p", "5555"] + SSH_OPTS
+                   + ["-O", "exit", "root@localhost"])
+        self.logger.debug("CMD: %s", _LazyCmd(ssh_cmd))
+
+        p = subprocess.run(ssh_cmd, capture_output=True, text=True)
+        if p.returncode != 0:
+            # The master can vanish between the socket check and the
+            # command; a failed exit only means nothing was left to
+            # close, so it is not worth an ERROR on every teardown
+            self.logger.debug("Closing ssh master failed: %s", p.stderr)
             return False
         return True
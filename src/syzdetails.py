@@ -1,17 +1,41 @@
 #!/usr/bin/env python3
 
+import gzip
+import hashlib
+import json
 import logging
-import pandas as pd
+import lxml.html
+import requests
+import socket
+import sys
+import threading
+import time
+import os
+import zlib
 
-from io import StringIO
-from src.syzcommon import SyzCommon
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from src.syzcommon import SyzCommon, RED, ENDC
 
-# Terminal formatting
-RED = "\033[31m"
-ENDC = '\033[0m'
+CACHE_DIR = os.path.expanduser("~/.cache/syztriage")
+
+FETCH_WORKERS = 8
+SYZBOT_BASE = "https://syzkaller.appspot.com"
+# One libxml2 parser instance, tolerant of the malformed markup syzbot
+# pages occasionally serve; never fall back to slower parser flavors
+HTML_PARSER = lxml.html.HTMLParser(recover=True)
+# Every real syzbot page links back to the dashboard; the marker is
+# matched against the raw bytes while the response streams in
+REPORT_MARKER = b'>syzbot</a>'
+# Parsed crash tables are memoized per process for this long; the HTML
+# itself is already cached on disk with ETag revalidation
+DETAILS_TTL = 3600
 
 
 class SyzDetails(SyzCommon):
+    # Class attribute so subclasses that skip __init__ still inherit the
+    # default; override to validate pages from another dashboard
+    report_marker = REPORT_MARKER
+
     def __init__(self) -> None:
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.INFO)
@@ -27,80 +51,312 @@ class SyzDetails(SyzCommon):
             str: The content of the bug report.
 
         Raises:
-            ConnectionError: If the `curl` command fails.
+            ConnectionError: If the HTTP request fails.
             ValueError: If the validation string is not found in the
             fetched report.
         """
-        report_validation = '>syzbot</a>'
-        cmd_dump_report = ["curl", url]
-        self.logger.debug("CMD: " + " ".join(cmd_dump_report))
+        # Keep curl's scheme defaulting for bare host names
+        if "://" not in url:
+            url = "http://" + url
+        # %-style args so the message is only built when DEBUG is live
+        self.logger.debug("Fetching bug report: %s", url)
 
         if dry_run:
             return None
 
-        if not self.run_cmd(cmd_dump_report,
-                            "Fetching bug report has failed!",
-                            dump_std=True):
-            self.logger.error(self.stderr)
+        try:
+            report = self._cached_get(url)
+        except requests.RequestException as err:
+            self.logger.error(err)
             raise ConnectionError
 
-        if report_validation not in self.stdout:
+        if not getattr(self._get_fetch_state(), "report_valid", False):
             raise ValueError
-        return self.stdout
+        # The body stays bytes through fetch and cache; pay for the
+        # UTF-8 decode only once the report is known to be genuine
+        return report.decode("utf-8", errors="replace")
 
-    def _find_crashes(self, bug_html):
+    def _cached_get(self, url):
         """
-        Extracts crash data from the provided bug report HTML.
+        Fetches a URL through the on-disk HTML cache.
+
+        Bodies are stored gzip-compressed under a sha1 key next to their
+        response validators; later fetches send a conditional request and
+        an HTTP 304 answer is served from disk with no body transfer.
+        Controlled by the no_cache / cache_max_age attributes set from
+        the command line.
 
         Args:
-            bug_html (str): The HTML content of the bug report.
+            url (str): The URL to fetch.
 
         Returns:
-        DataFrame or None: A DataFrame containing the extracted crash data
-        if the validation string is present in the HTML; otherwise, `None`.
+            bytes: The raw response body.
+
+        Raises:
+            requests.RequestException: If the HTTP request fails.
         """
-        report_validation = '<caption>Crashes'
-        if report_validation not in bug_html:
+        if getattr(self, "no_cache", False):
+            with self._get_session().get(url, timeout=30,
+                                         stream=True) as response:
+                response.raise_for_status()
+                return self._stream_body(response)
+
+        key = hashlib.sha1(url.encode()).hexdigest()
+        body_path = os.path.join(CACHE_DIR, f"{key}.html.gz")
+        meta_path = os.path.join(CACHE_DIR, f"{key}.meta.json")
+
+        headers = {}
+        cached = os.path.exists(body_path)
+        if cached:
+            max_age = getattr(self, "cache_max_age", None)
+            if max_age and time.time() - os.path.getmtime(body_path) < max_age:
+                body = self._read_cached_body(body_path)
+                if body is not None:
+                    self.logger.debug("Cache hit (fresh): %s", url)
+                    return body
+                cached = False
+        if cached and os.path.exists(meta_path):
+            # A damaged meta file is just a cache miss, not a crash
+            try:
+                with open(meta_path) as f:
+                    meta = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                meta = {}
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        body = None
+        with self._get_session().get(url, timeout=30, headers=headers,
+                                     stream=True) as response:
+            if cached and response.status_code == 304:
+                body = self._read_cached_body(body_path)
+                if body is not None:
+                    self.logger.debug("Cache hit (revalidated): %s", url)
+                    return body
+            else:
+                response.raise_for_status()
+                body = self._stream_body(response)
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+
+        if body is None:
+            # The server said 304 but the cached body was unreadable;
+            # refetch without the conditional headers
+            with self._get_session().get(url, timeout=30,
+                                         stream=True) as response:
+                response.raise_for_status()
+                body = self._stream_body(response)
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+
+        self._write_cache_entry(body_path, meta_path, body, etag,
+                                last_modified)
+        return body
+
+    def _write_cache_entry(self, body_path, meta_path, body, etag,
+                           last_modified):
+        """
+        Stores a response body and its metadata in the cache atomically.
+
+        Both files go through a temp file and os.replace so a run killed
+        mid-write can never leave a truncated entry behind; a failed
+        cache write only costs the cache, not the fetch.
+
+        Args:
+            body_path (str): Final path of the gzipped body.
+            meta_path (str): Final path of the metadata JSON.
+            body (bytes): The raw response body.
+            etag (str or None): The response ETag header.
+            last_modified (str or None): The Last-Modified header.
+        """
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp = f"{body_path}.tmp-{os.getpid()}"
+            with gzip.open(tmp, "wb") as f:
+                f.write(body)
+            os.replace(tmp, body_path)
+            tmp = f"{meta_path}.tmp-{os.getpid()}"
+            with open(tmp, "w") as f:
+                json.dump({"etag": etag, "last_modified": last_modified}, f)
+            os.replace(tmp, meta_path)
+        except OSError as err:
+            self.logger.debug("Cache write failed: %s", err)
+
+    def _get_fetch_state(self):
+        """
+        Returns the per-thread fetch state, creating it lazily.
+
+        The validation verdict of a fetch must not leak between the
+        batch worker threads, so it lives on a threading.local rather
+        than a plain instance attribute.
+
+        Returns:
+            threading.local: The calling thread's state object.
+        """
+        if not hasattr(self, "_fetch_state"):
+            self._fetch_state = threading.local()
+        return self._fetch_state
+
+    def _prewarm_dns(self):
+        """
+        Resolves the syzbot host once in the background.
+
+        Started before the first fetch so name resolution overlaps with
+        the remaining setup instead of sitting on the critical path of
+        the first request; the resolver cache then serves the pooled
+        connections that follow. Failures are ignored — the real fetch
+        reports them properly.
+        """
+        if hasattr(self, "_dns_warm"):
+            return
+        self._dns_warm = True
+        host = SYZBOT_BASE.split("://", 1)[1]
+
+        def resolve():
+            try:
+                socket.getaddrinfo(host, 443)
+            except OSError:
+                pass
+
+        threading.Thread(target=resolve, daemon=True).start()
+
+    def _stream_body(self, response):
+        """
+        Reads a streamed response, validating it while it transfers.
+
+        The syzbot marker is searched chunk by chunk as the body arrives,
+        so the page is scanned exactly once instead of a second full pass
+        over the buffered text, and error statuses abort before any
+        buffering at all. The verdict lands in the per-thread fetch
+        state.
+
+        Args:
+            response (requests.Response): A response opened with
+            stream=True.
+
+        Returns:
+            bytes: The raw response body.
+        """
+        if not hasattr(self, "_transport_logged"):
+            self._transport_logged = True
+            version = getattr(response.raw, "version", 0)
+            self.logger.debug("HTTP transport: HTTP/%.1f over pooled"
+                              " connections", version / 10 if version else 0)
+        marker = self.report_marker
+        state = self._get_fetch_state()
+        state.report_valid = False
+        tail = b""
+        chunks = []
+        for chunk in response.iter_content(chunk_size=16384):
+            if not state.report_valid and marker in tail + chunk:
+                state.report_valid = True
+            tail = (tail + chunk)[-(len(marker) - 1):]
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    def _read_cached_body(self, body_path):
+        """
+        Reads a gzip-compressed cached response body.
+
+        Args:
+            body_path (str): Path of the cached body file.
+
+        Returns:
+            bytes or None: The decompressed body, or None when the file
+            is corrupt or truncated (callers treat that as a miss).
+        """
+        try:
+            with gzip.open(body_path, "rb") as f:
+                body = f.read()
+        except (OSError, EOFError, zlib.error) as err:
+            self.logger.debug("Unreadable cache entry %s: %s",
+                              body_path, err)
             return None
-        return pd.read_html(StringIO(bug_html), match="Crashes",
-                            extract_links="body")[1]
+        # Cached bodies were validated when first fetched, but re-derive
+        # the flag so stale or foreign cache files cannot pass as valid
+        self._get_fetch_state().report_valid = \
+            body.find(self.report_marker) >= 0
+        return body
 
-    def _analyze_crashes(self, crash_table):
+    def _extract_crashes(self, bug_html):
         """
-        Analyzes and extracts valid crash information from the given crash
-        table.
+        Extracts valid crash information from the bug report HTML.
+
+        A single lxml pass over the "Crashes" table replaces the former
+        pandas read_html machinery, which parsed every table on the page
+        into DataFrames only for three columns to be read back out.
 
         Args:
-            crash_table (DataFrame): A pandas DataFrame containing crash
-                                     information. Expected columns include
-                                     "Commit", "C repro", and "Config".
+            bug_html (str): The HTML content of the bug report.
 
         Returns:
-            list: A list of dictionaries, each containing information about
-                  a valid crash.
-                  Each dictionary contains the following keys:
-                  - "commit" (str): The commit identifier of the crash.
-                  - "config_url" (str): The URL to the configuration file.
-                  - "c_repro_uri" (str): The URL to the "C repro" file.
+            list or None: A list of dictionaries, one per crash with a C
+            reproducer, or `None` if the crash table is missing. Each
+            dictionary contains the following keys:
+                - "repo_url" (str): The URL of the kernel repository.
+                - "commit" (str): The commit identifier of the crash.
+                - "config_url" (str): The URL to the configuration file.
+                - "c_repro_uri" (str): The URL to the "C repro" file.
         """
+        report_validation = '<caption>Crashes'
+        caption_at = bug_html.find(report_validation)
+        if caption_at < 0:
+            return None
+
+        # Syzbot pages carry several other tables (Bisection, Fix
+        # candidates, ...); hand the parser only the Crashes table and
+        # fall back to the whole page if the markup does not line up
+        start = bug_html.rfind('<table', 0, caption_at)
+        end = bug_html.find('</table>', caption_at)
+        if start >= 0 and end >= 0:
+            bug_html = bug_html[start:end + len('</table>')]
+
+        tree = lxml.html.fromstring(bug_html, parser=HTML_PARSER)
+        tables = tree.xpath(
+            '//table[caption[starts-with(normalize-space(.), "Crashes")]]'
+        )
+        if not tables:
+            return None
+
+        rows = tables[0].xpath('.//tr')
+        headers = [th.text_content().strip() for th in rows[0].xpath('./th')]
+        try:
+            commit_idx = headers.index("Commit")
+            config_idx = headers.index("Config")
+            c_repro_idx = headers.index("C repro")
+        except ValueError:
+            return None
+
         valid_crashes = []
-        crash_commits = list(crash_table["Commit"])
-        for i, crash_commit in enumerate(crash_commits):
-            if not crash_table["C repro"][i][0]:
+        for row in rows[1:]:
+            cells = row.xpath('./td')
+            if len(cells) <= c_repro_idx:
                 continue
-            config_url = ("https://syzkaller.appspot.com"
-                          f"{crash_table['Config'][i][1]}")
-            c_repro_uri = ("https://syzkaller.appspot.com"
-                           f"{crash_table['C repro'][i][1]}")
+            c_repro_links = cells[c_repro_idx].xpath('./a')
+            if not c_repro_links:
+                continue
+            commit_links = cells[commit_idx].xpath('./a')
+            config_links = cells[config_idx].xpath('./a')
+            repo_url = (commit_links[0].get("href")
+                        if commit_links else None)
             valid_crashes.append(
                 {
-                    "repo_url": crash_commit[1],
-                    "commit": crash_commit[0],
-                    "config_url": config_url,
-                    "c_repro_uri": c_repro_uri,
+                    # Commits, repo and config URLs repeat heavily across
+                    # the rows of one bug; interning makes all duplicate
+                    # rows share a single str object
+                    "repo_url": (sys.intern(repo_url)
+                                 if repo_url is not None else None),
+                    "commit": sys.intern(
+                        cells[commit_idx].text_content().strip()),
+                    "config_url": sys.intern(
+                        SYZBOT_BASE + config_links[0].get("href")),
+                    "c_repro_uri": (SYZBOT_BASE
+                                    + c_repro_links[0].get("href")),
                 }
             )
-            self.logger.debug(valid_crashes[-1])
+            self.logger.debug("%s", valid_crashes[-1])
         return valid_crashes
 
     def get_bug_details(self, url, dry_run=False):
@@ -133,23 +389,128 @@ class SyzDetails(SyzCommon):
                      "c_repro_uri": ("https://syzkaller.appspot.com/text?tag=R"
                                      "eproC&x=112f45d4980000")}]
 
+        crashes = self._memoized_details(url)
+        if crashes is not None:
+            return crashes
+
+        self._prewarm_dns()
         try:
             bug_html = self._fetch_bug_report(url)
             self.logger.debug(bug_html)
         except ConnectionError:
-            self.logger.error(f"{RED}curl has failed during fetch!{ENDC}")
+            self.logger.error(f"{RED}Bug report fetch has failed!{ENDC}")
             return None
         except ValueError:
             self.logger.error(f"{RED}URL does not provide syzbot report!"
                               f"{ENDC}")
             return None
-        crash_table = self._find_crashes(bug_html)
-        if crash_table is None:
+        return self._remember_details(url, self._analyze_bug_html(bug_html))
+
+    def _memoized_details(self, url):
+        """
+        Returns the memoized crash list for a URL if still fresh.
+
+        Args:
+            url (str): The URL of the bug report.
+
+        Returns:
+            list or None: The parsed crash dictionaries recorded within
+            the last DETAILS_TTL seconds, or None on a miss.
+        """
+        if not hasattr(self, "_details_memo"):
+            self._details_memo = {}
+        entry = self._details_memo.get(url)
+        if entry is None:
+            return None
+        stamp, crashes = entry
+        if time.monotonic() - stamp > DETAILS_TTL:
+            del self._details_memo[url]
+            return None
+        self.logger.debug("Details memo hit: %s", url)
+        return crashes
+
+    def _remember_details(self, url, crashes):
+        """
+        Memoizes a successfully parsed crash list for a URL.
+
+        Args:
+            url (str): The URL of the bug report.
+            crashes (list or None): The parsed crash dictionaries.
+
+        Returns:
+            list or None: The crashes argument, unchanged, so callers
+            can return through this method.
+        """
+        if crashes:
+            if not hasattr(self, "_details_memo"):
+                self._details_memo = {}
+            self._details_memo[url] = (time.monotonic(), crashes)
+        return crashes
+
+    def _analyze_bug_html(self, bug_html):
+        """
+        Extracts and analyzes the crash table from bug report HTML.
+
+        Args:
+            bug_html (str): The HTML content of the bug report.
+
+        Returns:
+            list or None: A list of valid crash dictionaries, or None if
+            the crash table is missing or holds no valid crashes.
+        """
+        valid_crashes = self._extract_crashes(bug_html)
+        if valid_crashes is None:
             self.logger.error(f"{RED}Crash table not found in the bug HTML!"
                               f"{ENDC}")
             return None
-        valid_crashes = self._analyze_crashes(crash_table)
         if not valid_crashes:
             self.logger.error(f"{RED}No valid crashes found!{ENDC}")
             return None
         return valid_crashes
+
+    def get_bug_details_batch(self, urls, dry_run=False, workers=None):
+        """
+        Retrieves and analyzes bug details for many URLs concurrently.
+
+        The network-bound fetches fan out over a bounded thread pool
+        sharing the pooled HTTP session, while the CPU-bound crash-table
+        parsing stays on the calling thread.
+
+        Args:
+            urls (list): The URLs of the bug reports to fetch and analyze.
+            dry_run (bool): If flag is true method does not execute commands
+            workers (int): Fetch thread count; defaults to FETCH_WORKERS.
+
+        Returns:
+            dict: Mapping of each URL to its list of valid crash
+            dictionaries, or to None if fetching or analysis failed.
+        """
+        if dry_run:
+            return {url: self.get_bug_details(url, dry_run=dry_run)
+                    for url in urls}
+
+        self._prewarm_dns()
+        # Create the thread-local holder before the pool spawns so the
+        # lazy hasattr check never races between workers
+        self._get_fetch_state()
+        details = dict.fromkeys(urls)
+        for url in urls:
+            details[url] = self._memoized_details(url)
+        with ThreadPoolExecutor(max_workers=workers or FETCH_WORKERS) as pool:
+            futures = {pool.submit(self._fetch_bug_report, url): url
+                       for url in urls if details[url] is None}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    bug_html = future.result()
+                except ConnectionError:
+                    self.logger.error(f"{RED}Bug report fetch has failed!"
+                                      f"{ENDC}")
+                    continue
+                except ValueError:
+                    self.logger.error(f"{RED}URL does not provide syzbot"
+                                      f" report!{ENDC}")
+                    continue
+                details[url] = self._remember_details(
+                    url, self._analyze_bug_html(bug_html))
+        return details
@@ -3,6 +3,8 @@
 import os
 import logging
 
+from src.syzcommon import RED, ENDC
+
 INTERNAL_BUGS = {
     "KERN-48": "34afb82a3c67",
     "KERN-49": "34afb82a3c67",
@@ -18,10 +20,16 @@ INTERNAL_BUGS = {
 
 INTERNAL_CONFIG = ("https://syzkaller.appspot.com/text?tag=KernelConfig&x="
                    "c3820d4fff43c7a3")
+REPO_BASE = ("https://git.kernel.org/pub/scm/linux/kernel/git/torvalds/"
+             "linux.git/log/?id=")
+# The bug list is static, so the URLs and reproducer paths are built
+# once at import; the method only has to check that the files exist
+INTERNAL_ENTRIES = [
+    (bug, commit, REPO_BASE + commit, f"repro-{bug}.c")
+    for bug, commit in INTERNAL_BUGS.items()
+]
+REPRO_DIR = "internal-repro"
 
-# Terminal formatting
-RED = "\033[31m"
-ENDC = '\033[0m'
 
 
 class SyzInternal():
@@ -55,19 +63,23 @@ class SyzInternal():
                      "c_repro_uri": "internal-repro/repro-KERN-X.c",
                      "task_name": "KERNX"}]
 
-        for bug in INTERNAL_BUGS:
-            repro_c_path = os.path.join("internal-repro", f"repro-{bug}.c")
-            self.logger.debug(f"repro C path: {repro_c_path}")
-            if not os.path.exists(repro_c_path):
-                self.logger.error(f"{RED}C reproducer for {bug} does not"
-                                  f" exist. Should be placed in "
-                                  f"{repro_c_path}{ENDC}")
+        # One directory read instead of a stat() per bug
+        try:
+            repro_files = {entry.name for entry in os.scandir(REPRO_DIR)}
+        except FileNotFoundError:
+            repro_files = set()
+
+        for bug, commit, repo_url, repro_c_name in INTERNAL_ENTRIES:
+            repro_c_path = os.path.join(REPRO_DIR, repro_c_name)
+            self.logger.debug("repro C path: %s", repro_c_path)
+            if repro_c_name not in repro_files:
+                self.logger.error(RED + "C reproducer for %s does not"
+                                  " exist. Should be placed in %s" + ENDC,
+                                  bug, repro_c_path)
                 return None
             valid_crashes.append({
-                "repo_url": ("https://git.kernel.org/pub/scm/linux/kernel"
-                             "/git/torvalds/linux.git/log/?id="
-                             f"{INTERNAL_BUGS[bug]}"),
-                "commit": INTERNAL_BUGS[bug],
+                "repo_url": repo_url,
+                "commit": commit,
                 "config_url": INTERNAL_CONFIG,
                 "c_repro_uri": repro_c_path,
                 "task_name": bug
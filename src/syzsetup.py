@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 
+import hashlib
 import logging
 import multiprocessing
 import os
 
-from src.syzcommon import SyzCommon
+from concurrent.futures import ThreadPoolExecutor
+from src.syzcommon import SyzCommon, RED, GREEN, YELLOW, ENDC
 
 PREFIX_REMOTE = "https://git.kernel.org/pub/scm/linux/kernel/git/"
 LTS_REMOTE = "https://git.kernel.org/pub/scm/linux/kernel/git/stable/linux.git"
@@ -13,13 +15,11 @@ NET_REMOTE = "https://git.kernel.org/pub/scm/linux/kernel/git/netdev/net.git"
 UPSTREAM_REMOTE = (
     "https://git.kernel.org/pub/scm/linux/kernel/git/torvalds/linux.git"
 )
+# One ccache shared across every kernel checkout, sized generously so
+# object files survive between commits and repositories
+CCACHE_DIR = os.path.expanduser("~/.cache/syztriage-ccache")
+CCACHE_SIZE = "50G"
 
-# Terminal formatting
-BOLD = "\033[1m"
-RED = "\033[31m"
-GREEN = "\033[32m"
-YELLOW = "\033[33m"
-ENDC = '\033[0m'
 
 
 class SyzSetup(SyzCommon):
@@ -28,13 +28,16 @@ class SyzSetup(SyzCommon):
         self.logger.setLevel(logging.DEBUG)
 
     def _check_kernel_remote(self, repo_path: str, remote_uri: str,
-                             dry_run=False):
+                             auto_fetch=True, dry_run=False):
         """
         Checks and manages the remote repository configuration for the kernel.
 
         Parameters:
         repo_path (str): The local path to the kernel repository.
         remote_uri (str): The URI of the remote repository.
+        auto_fetch (bool): If True, a newly added remote is fetched in
+                           the same git invocation; probe-only callers
+                           pass False to skip the transfer.
         dry_run (bool): If True, simulates the entire process without making
                         any changes (default is False).
 
@@ -48,12 +51,13 @@ class SyzSetup(SyzCommon):
             return False
 
         if not os.path.exists(repo_path) and not dry_run:
-            self.logger.error(f"{RED}Repository doesn't exist!{ENDC}")
-            self.logger.error(f"{RED}Kernel check has failed!{ENDC}")
+            self._err("Repository doesn't exist!")
+            self._err("Kernel check has failed!")
             return False
 
         repo_name = remote_uri.split(PREFIX_REMOTE)[1].split(".git")[0]
         self.logger.debug(f"Repository name: {repo_name}")
+        self.remote_fetched = False
         if self.check_repository_remote(repo_path, repo_name,
                                         dry_run=dry_run):
             self.logger.debug(f"Repository remote exists: {remote_uri}")
@@ -62,9 +66,12 @@ class SyzSetup(SyzCommon):
         self.logger.debug("Repository remote doesn't exist. "
                           f"Adding new remote: {remote_uri}")
         if not self.add_repository_remote(repo_path, remote_uri, repo_name,
+                                          auto_fetch=auto_fetch,
                                           dry_run=dry_run):
             return False
         self.remote_name = repo_name
+        # git remote add -f already fetched the new remote
+        self.remote_fetched = auto_fetch
         return True
 
     def _setup_kernel_config(self, repo_path: str, config_uri, dry_run=False):
@@ -82,27 +89,87 @@ class SyzSetup(SyzCommon):
         bool: True if the kernel configuration file is successfully set up
               or if dry_run is True, False otherwise.
         """
-        cmd_download_config = ["curl", config_uri, "-o", ".config"]
-        self.logger.debug("CMD: " + " ".join(cmd_download_config))
+        # Download straight to its destination over the pooled session;
+        # no cwd change and no curl process per transfer, so this stage
+        # can safely run concurrently with the remote fetch
+        config_dest = f"{repo_path}/.config"
+        self.logger.debug(f"GET {config_uri} -> {config_dest}")
 
         if dry_run:
             return True
 
-        workspace_dir = os.getcwd()
         if not os.path.exists(repo_path):
-            self.logger.error(f"{RED}Repository doesn't exist!{ENDC}")
+            self._err("Repository doesn't exist!")
             return False
 
-        self.logger.debug(f"CMD: cd {repo_path}")
-        os.chdir(repo_path)
+        if not self.fetch_to_file(config_uri, config_dest,
+                                  f"{RED}Downloading kernel config failed!"
+                                  f"{ENDC}"):
+            return False
+        return True
+
+    def _head_matches(self, repo_path, commit, dry_run=False):
+        """
+        Checks whether HEAD already sits on the requested commit.
 
-        if not self.run_cmd(cmd_download_config,
-                            f"{RED}Downloading kernel config failed!{ENDC}"):
-            os.chdir(workspace_dir)
+        Parameters:
+        repo_path (str): The local path to the kernel repository.
+        commit (str): The requested commit hash, possibly abbreviated.
+        dry_run (bool): If True, always reports a mismatch so dry runs
+                        exercise the full setup path (default is False).
+
+        Returns:
+        bool: True if HEAD resolves to the requested commit.
+        """
+        if dry_run or not commit:
+            return False
+        if not self.run_cmd(["git", "-C", repo_path, "rev-parse", "HEAD"],
+                            f"{YELLOW}Resolving HEAD failed!{ENDC}",
+                            dump_std=True):
             return False
+        return self.stdout.strip().startswith(commit)
 
-        os.chdir(workspace_dir)
-        return True
+    def _kernel_build_key(self, repo_path):
+        """
+        Derives a key identifying the inputs of a kernel build.
+
+        The key combines the checked-out commit with a hash of .config,
+        so a repeat reproduction with identical inputs can skip the
+        build entirely.
+
+        Parameters:
+        repo_path (str): The local path to the kernel repository.
+
+        Returns:
+        str or None: The build key, or None when HEAD or .config cannot
+                     be read (callers then rebuild unconditionally).
+        """
+        config_path = os.path.join(repo_path, ".config")
+        try:
+            with open(config_path, "rb") as f:
+                config_hash = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
+        if not self.run_cmd(["git", "-C", repo_path, "rev-parse", "HEAD"],
+                            f"{YELLOW}Resolving HEAD failed!{ENDC}",
+                            dump_std=True):
+            return None
+        return f"{self.stdout.strip()}-{config_hash[:16]}"
+
+    def _setup_ccache(self):
+        """
+        Points ccache at the shared cache directory and sizes it.
+
+        Run once before a build so compilations across commits and
+        repositories hit one warm cache. A failing ccache invocation is
+        logged but does not abort the build.
+        """
+        os.makedirs(CCACHE_DIR, exist_ok=True)
+        os.environ["CCACHE_DIR"] = CCACHE_DIR
+        if hasattr(self, "_cached_env"):
+            self._cached_env["CCACHE_DIR"] = CCACHE_DIR
+        self.run_cmd(["ccache", "-M", CCACHE_SIZE],
+                     f"{YELLOW}Sizing ccache failed!{ENDC}", dump_std=True)
 
     def _build_kernel(self, repo_path, dry_run=False):
         """
@@ -118,39 +185,47 @@ class SyzSetup(SyzCommon):
               False otherwise.
         """
         nproc = multiprocessing.cpu_count()
-        cmd_kernel_conf = ["make", f"-j{nproc}", "LLVM=1", "LLVM_IAS=1",
-                           'CC=ccache clang', "ARCH=x86_64", "olddefconfig"]
+        # One make run covers config and build, so the Kbuild tree is
+        # parsed once instead of per invocation; the empty timestamp
+        # keeps rebuilds byte-identical and ccache-friendly
         cmd_build_kernel = ["make", f"-j{nproc}", "LLVM=1", "LLVM_IAS=1",
-                            'CC=ccache clang', "ARCH=x86_64", "all",
-                            "compile_commands.json"]
+                            'CC=ccache clang', "ARCH=x86_64",
+                            "KBUILD_BUILD_TIMESTAMP=", "olddefconfig",
+                            "all", "compile_commands.json"]
 
-        self.logger.debug("CMD: " + " ".join(cmd_kernel_conf))
         self.logger.debug("CMD: " + " ".join(cmd_build_kernel))
         if dry_run:
             return True
 
-        workspace_dir = os.getcwd()
         if not os.path.exists(repo_path):
-            self.logger.error(f"{RED}Repository doesn't exist!{ENDC}")
+            self._err("Repository doesn't exist!")
             return False
 
-        self.logger.debug(f"CMD: cd {repo_path}")
-        os.chdir(repo_path)
+        # Skip the whole build when the same commit and config were
+        # already built here; the marker is touched after success
+        build_key = self._kernel_build_key(repo_path)
+        marker_path = (os.path.join(repo_path,
+                                    f".syztriage_built_{build_key}")
+                       if build_key else None)
+        if marker_path and os.path.exists(marker_path):
+            self.logger.info(f"{GREEN}Kernel already built for this commit"
+                             f" and config, skipping build.{ENDC}")
+            return True
 
-        if not os.path.exists(".config"):
-            self.logger.error(f"{RED}Kernel config does not exist!{ENDC}")
+        self._setup_ccache()
 
-        if not self.run_cmd(cmd_kernel_conf,
-                            f"{RED}Creating kernel config failed!{ENDC}"):
-            os.chdir(workspace_dir)
-            return False
+        if not os.path.exists(os.path.join(repo_path, ".config")):
+            self._err("Kernel config does not exist!")
 
+        # cwd= keeps make in the repository without touching the
+        # process-global working directory
         if not self.run_cmd(cmd_build_kernel,
-                            f"{RED}Building kernel failed!{ENDC}"):
-            os.chdir(workspace_dir)
+                            f"{RED}Building kernel failed!{ENDC}",
+                            cwd=repo_path):
             return False
 
-        os.chdir(workspace_dir)
+        if marker_path:
+            open(marker_path, "w").close()
         return True
 
     def setup_kernel_repository(self, crash_dict: dict, repo_path,
@@ -180,37 +255,65 @@ class SyzSetup(SyzCommon):
         elif "bpf/bpf" in crash_dict["repo_url"]:
             remote_uri = BFP_REMOTE
         else:
-            self.logger.error(f"{RED}Repository is not supported! Currently"
-                              " script supports only the upstream, bfp, net,"
-                              " and LTS Linux repositories.{ENDC}")
+            self._err("Repository is not supported! Currently script supports"
+                      " only the upstream, bfp, net, and LTS Linux"
+                      " repositories.")
             return False
 
+        # Consecutive bugs frequently share a base commit. When HEAD is
+        # already on the requested commit the remote, fetch and checkout
+        # stages are pure overhead, so only the config refresh and the
+        # marker-guarded build remain
+        if self._head_matches(repo_path, crash_dict["commit"],
+                              dry_run=dry_run):
+            self.logger.info(f"{GREEN}Commit {crash_dict['commit']} is "
+                             f"already checked out.{ENDC}")
+            if not self._setup_kernel_config(repo_path,
+                                             crash_dict["config_url"],
+                                             dry_run=dry_run):
+                self._err("Fetching kernel config failed!")
+                return False
+            if not self._build_kernel(repo_path, dry_run=dry_run):
+                self._err("Building kernel failed!")
+                return False
+            return True
+
         if not self._check_kernel_remote(repo_path, remote_uri,
                                          dry_run=dry_run):
-            self.logger.error(f"{RED}Setting kernel remote failed!{ENDC}")
+            self._err("Setting kernel remote failed!")
             return False
 
         if not self.remote_name:
-            self.logger.error(f"{RED}Remote name not set! It should be set"
-                              f" by _check_kernel_remote.{ENDC}")
+            self._err("Remote name not set! It should be set by "
+                      "_check_kernel_remote.")
             return False
 
-        if not self.fetch_repository_remote(repo_path, self.remote_name,
-                                            dry_run=dry_run):
-            self.logger.error(f"{RED}Fetching kernel remote failed!{ENDC}")
-            return False
+        # The remote fetch and the config download are independent
+        # network waits, so overlap them: the stage costs the longer of
+        # the two instead of their sum. The .config lands as an
+        # untracked file, so the checkout afterwards leaves it alone
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            fetch_job = None
+            if not getattr(self, "remote_fetched", False):
+                fetch_job = pool.submit(self.fetch_repository_remote,
+                                        repo_path, self.remote_name,
+                                        dry_run=dry_run)
+            config_job = pool.submit(self._setup_kernel_config, repo_path,
+                                     crash_dict["config_url"],
+                                     dry_run=dry_run)
+            if fetch_job is not None and not fetch_job.result():
+                self._err("Fetching kernel remote failed!")
+                return False
+            if not config_job.result():
+                self._err("Fetching kernel config failed!")
+                return False
 
         if not self.checkout_branch(repo_path, crash_dict["commit"],
                                     dry_run=dry_run):
-            self.logger.error(f"{RED}Kernel checkout failed!{ENDC}")
-            return False
-
-        if not self._setup_kernel_config(repo_path, crash_dict["config_url"],
-                                         dry_run=dry_run):
-            self.logger.error(f"{RED}Fetching kernel config failed!{ENDC}")
+            self._err("Kernel checkout failed!")
             return False
 
         if not self._build_kernel(repo_path, dry_run=dry_run):
-            self.logger.error(f"{RED}Building kernel failed!{ENDC}")
+            self._err("Building kernel failed!")
             return False
         return True
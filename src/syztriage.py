@@ -1,27 +1,38 @@
 #!/usr/bin/env python3
 import argparse
+import functools
 import logging
+import os
+import pathlib
 import time
 
+from src.syzcommon import BOLD, RED, GREEN, BLUE, ENDC
 from src.syzdetails import SyzDetails
 from src.syzsetup import SyzSetup
 from src.syzreproduce import SyzReproduce
 from src.syzinternal import SyzInternal
 
-# Terminal formatting
-BOLD = "\033[1m"
-RED = "\033[31m"
-GREEN = "\033[32m"
-YELLOW = "\033[33m"
-BLUE = "\033[34m"
-MAGENTA = "\033[35m"
-CYAN = "\033[36m"
-ENDC = '\033[0m'
-
 BUGS_LIST = [
     "https://syzkaller.appspot.com/bug?extid=824b138c39c77ad6775f",
 ]
 LINUX_REPO_PATH = "/home/nkaminski/data/infogain/linux"
+# The summary banners never change, so each colored rule is built once
+# at import instead of being re-assembled on every log call
+SEP_RED = f"{RED}{BOLD}{'=' * 70}{ENDC}"
+SEP_BLUE = f"{BLUE}{BOLD}{'=' * 70}{ENDC}"
+SEP_GREEN = f"{GREEN}{BOLD}{'=' * 70}{ENDC}"
+# Uncolored rule for the on-disk log, pre-encoded with its newline so
+# the per-bug write passes it straight to the kernel
+SEP_LOG = "=" * 91
+SEP_LOG_LINE = (SEP_LOG + "\r\n").encode()
+# Maps the (cause, status) pair from reproduce_issue onto a summary
+# bucket; anything unrecognized counts as an error
+_CAUSE_DISPATCH = {
+    ("Valid", True): "reproduced",
+    ("Dry run", True): "not_reproduced",
+    ("Invalid", False): "not_reproduced",
+    ("Err", False): "error",
+}
 
 
 class SyzTriage(SyzDetails, SyzSetup, SyzReproduce, SyzInternal):
@@ -31,6 +42,20 @@ class SyzTriage(SyzDetails, SyzSetup, SyzReproduce, SyzInternal):
         self.verbose = self._args.verbose or self._args.dry_run
         self.dry_run = self._args.dry_run
         self.internal_bugs = self._args.internal_bugs
+        self.no_cache = self._args.no_cache
+        self.cache_max_age = self._args.max_age
+        self.jobs = self._args.jobs
+        self.bugs_list = BUGS_LIST
+        if self._args.bugs_file:
+            try:
+                lines = self._args.bugs_file.read_text().splitlines()
+            except OSError as err:
+                self.args_parser.error(f"cannot read --bugs-file: {err}")
+            self.bugs_list = [line.strip() for line in lines
+                              if line.strip()]
+        # Resolved once; every callee then works with the same absolute
+        # path instead of re-normalizing the raw string
+        self.linux_repo = pathlib.Path(self._args.linux_repo).resolve()
         self._logger_setup(verbose=self.verbose)
 
     def _logger_setup(self, verbose=False):
@@ -44,11 +69,16 @@ class SyzTriage(SyzDetails, SyzSetup, SyzReproduce, SyzInternal):
         Returns:
             self.log (logger): logger handler
         """
-        logging.basicConfig(
-            level=logging.DEBUG if verbose else logging.INFO,
-            format="%(asctime)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
+        root = logging.getLogger()
+        # Only install handlers on a pristine root; basicConfig walks
+        # and locks the handler list, and a host application (or the
+        # test runner) may already have configured logging
+        if not root.handlers:
+            logging.basicConfig(
+                format="%(asctime)s - %(levelname)s - %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S"
+            )
+        root.setLevel(logging.DEBUG if verbose else logging.INFO)
         self.logger = logging.getLogger(__name__)
 
     def _cmdline_parser(self):
@@ -79,16 +109,73 @@ class SyzTriage(SyzDetails, SyzSetup, SyzReproduce, SyzInternal):
             action="store_true",
             help="Triage internal bugs."
         )
+        parser.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            default=None,
+            metavar="N",
+            help="Concurrent bug detail fetches (default: 8)."
+        )
+        parser.add_argument(
+            "--bugs-file",
+            type=pathlib.Path,
+            default=None,
+            metavar="FILE",
+            help="File with one syzbot bug URL per line (default: the"
+                 " built-in list)."
+        )
+        parser.add_argument(
+            "--linux-repo",
+            default=os.environ.get("SYZTRIAGE_LINUX_REPO", LINUX_REPO_PATH),
+            metavar="PATH",
+            help="Linux kernel repository used for the builds (default:"
+                 " $SYZTRIAGE_LINUX_REPO or the built-in path)."
+        )
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Do not use the on-disk bug report cache."
+        )
+        parser.add_argument(
+            "--max-age",
+            type=int,
+            default=None,
+            metavar="SECONDS",
+            help="Serve cached bug reports younger than SECONDS without"
+                 " revalidation."
+        )
         self.args_parser = parser
 
-    def triage_internal_syzkaller_bugs(self, dry_run=False):
+    @functools.cached_property
+    def _log_path(self):
         """
-        Triage internal Syzkaller bugs by reproducing them in a Linux
-        kernel environment.
+        Names the triage log for this run.
+
+        The timestamp is taken once on first use, so every _run_triage
+        call within a run lands in the same file instead of each
+        invocation minting its own name.
+
+        Returns:
+        pathlib.Path: The log file path.
+        """
+        return pathlib.Path(f"syztriage-{int(time.time())}.log")
+
+    def _run_triage(self, crashes, dry_run=False, **reproduce_kwargs):
+        """
+        Runs the shared triage loop over named crash dictionaries.
+
+        Both public triage entry points only differ in how they collect
+        their crashes; the per-bug setup, reproduction, log writing and
+        summary reporting live here once.
 
         Parameters:
+        crashes (list): Pairs of (name, crash_dict); crash_dict is None
+                        when fetching the bug details already failed.
         dry_run (bool): If True, simulates the entire triage process without
                         making any changes (default is False).
+        reproduce_kwargs: Extra keyword arguments forwarded to
+                          reproduce_issue (e.g. internal=True).
 
         Returns:
         bool: True if all bugs were triaged successfully or if dry_run is
@@ -97,105 +184,94 @@ class SyzTriage(SyzDetails, SyzSetup, SyzReproduce, SyzInternal):
         bugs_reproduced = []
         bugs_not_reproduced = []
         bugs_error = []
-        status = False
-        log_file_name = f"syztriage-{int(time.time())}.log"
-        with open(log_file_name, "a+") as f:
-            self.logger.info("Getting internal bug details.")
-            valid_crashes = self.get_internal_bug_details(dry_run=dry_run)
-            if not valid_crashes:
-                self.logger.error(f"{RED}Getting bug details failed!"
-                                  f"{ENDC}")
-                return False
-            for crash_dict in valid_crashes:
-                self.logger.info("Setting up Linux repository.")
+        buckets = {
+            "reproduced": bugs_reproduced,
+            "not_reproduced": bugs_not_reproduced,
+            "error": bugs_error,
+        }
+        # Bound method lookups hoisted out of the loop; every iteration
+        # logs several times
+        log_info = self.logger.info
+        log_err = self._err
+        # The timestamped file is always new. Each bug produces exactly
+        # one vectored write, so the file stays raw and unbuffered: the
+        # header rules go out pre-encoded with no intermediate copy
+        with open(self._log_path, "wb", buffering=0) as f:
+            for name, crash_dict in crashes:
+                log_info("Processing bug: %s", name)
+                if crash_dict is None:
+                    log_err("Getting bug details failed!")
+                    bugs_error.append(name)
+                    continue
+                log_info("Setting up Linux repository.")
                 if not self.setup_kernel_repository(crash_dict,
-                                                    LINUX_REPO_PATH,
+                                                    self.linux_repo,
                                                     dry_run=dry_run):
-                    self.logger.error(f"{RED}Setting up Linux repository "
-                                      f"failed!{ENDC}")
-                    bugs_error.append(crash_dict["task_name"])
+                    log_err("Setting up Linux repository failed!")
+                    bugs_error.append(name)
                     continue
-                self.logger.info("Reproducing bug.")
+                log_info("Reproducing bug.")
                 status, cause = self.reproduce_issue(crash_dict,
-                                                     LINUX_REPO_PATH,
+                                                     self.linux_repo,
                                                      dry_run=dry_run,
-                                                     internal=True)
-                f.writelines("================================================"
-                             "===========================================\r\n")
-                f.writelines(f"{crash_dict['task_name']}\r\n")
-                f.writelines("================================================"
-                             "===========================================\r\n")
-                if self.vm_stdout:
-                    f.write(self.vm_stdout)
+                                                     **reproduce_kwargs)
+                # One syscall per bug: the header and console dump land
+                # together via writev without being joined first
+                os.writev(f.fileno(),
+                          (SEP_LOG_LINE, f"{name}\r\n".encode(),
+                           SEP_LOG_LINE, (self.vm_stdout or "").encode()))
 
-                if status and cause == "Valid":
-                    bugs_reproduced.append(crash_dict["task_name"])
-                    continue
-                elif status and cause == "Dry run":
-                    bugs_not_reproduced.append(crash_dict["task_name"])
-                    continue
-                elif cause == "Err":
-                    self.logger.error(f"{RED}Error during bug reproduction!"
-                                      f"{ENDC}")
-                    bugs_error.append(crash_dict["task_name"])
-                elif cause == "Invalid":
-                    bugs_not_reproduced.append(crash_dict["task_name"])
-                    continue
-                else:
-                    self.logger.error(f"{RED}Error during bug reproduction!"
-                                      f"{ENDC}")
-                    bugs_error.append(crash_dict["task_name"])
+                bucket = _CAUSE_DISPATCH.get((cause, bool(status)), "error")
+                if bucket == "error":
+                    log_err("Error during bug reproduction!")
+                buckets[bucket].append(name)
 
-        if not bugs_error and not bugs_not_reproduced and not bugs_reproduced:
-            self.logger.error(f"{RED}{BOLD}=============================="
-                              f"====================================={ENDC}")
-            self.logger.error(f"{RED}No bugs were processed!{ENDC}")
-            self.logger.error(f"{RED}{BOLD}=============================="
-                              f"====================================={ENDC}")
-            return status
+        # The overall verdict depends only on the buckets: something
+        # must have been processed and nothing may have errored. The
+        # old status variable leaked the last iteration's reproduction
+        # result into the return value
+        processed_any = bool(bugs_reproduced or bugs_not_reproduced
+                             or bugs_error)
+        if not processed_any:
+            self.logger.error(SEP_RED)
+            self._err("No bugs were processed!")
+            self.logger.error(SEP_RED)
+            return False
 
-        if not bugs_error:
-            status = True
-        else:
-            self.logger.error(f"{RED}{BOLD}=============================="
-                              f"====================================={ENDC}")
-            self.logger.error(f"{RED}{BOLD}Some errors happened"
-                              f" during reproduction of the bugs!{ENDC}")
-            self.logger.error(f"{RED}{BOLD}=============================="
-                              f"====================================={ENDC}")
+        if bugs_error:
+            self.logger.error(SEP_RED)
+            self.logger.error("%sSome errors happened during reproduction"
+                              " of the bugs!%s", RED + BOLD, ENDC)
+            self.logger.error(SEP_RED)
             for i, bug in enumerate(bugs_error):
-                self.logger.error(f"{RED}{BOLD}{i+1}. {bug}{ENDC}")
-            self.logger.error(f"{RED}{BOLD}=============================="
-                              f"====================================={ENDC}")
+                self.logger.error("%s%d. %s%s", RED + BOLD, i + 1, bug, ENDC)
+            self.logger.error(SEP_RED)
 
-        if bugs_not_reproduced:
-            self.logger.info(f"{BLUE}{BOLD}=============================="
-                             f"======================================={ENDC}")
-            self.logger.info(f"{BLUE}{BOLD}Some bugs were not "
-                             f"reproduced.{ENDC}")
-            self.logger.info(f"{BLUE}{BOLD}=============================="
-                             f"======================================={ENDC}")
+        # The INFO summaries only matter when INFO is live; the guard
+        # skips the whole enumeration otherwise
+        if bugs_not_reproduced and self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(SEP_BLUE)
+            self.logger.info("%sSome bugs were not reproduced.%s",
+                             BLUE + BOLD, ENDC)
+            self.logger.info(SEP_BLUE)
             for i, bug in enumerate(bugs_not_reproduced):
-                self.logger.info(f"{BLUE}{i+1}. {bug}{ENDC}")
-            self.logger.info(f"{BLUE}{BOLD}=============================="
-                             f"======================================={ENDC}")
+                self.logger.info("%s%d. %s%s", BLUE, i + 1, bug, ENDC)
+            self.logger.info(SEP_BLUE)
 
-        if bugs_reproduced:
-            self.logger.info(f"{GREEN}{BOLD}=============================="
-                             f"========================================{ENDC}")
-            self.logger.info(f"{GREEN}{BOLD}Some bugs were reproduced.{ENDC}")
-            self.logger.info(f"{GREEN}{BOLD}=============================="
-                             f"========================================{ENDC}")
+        if bugs_reproduced and self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(SEP_GREEN)
+            self.logger.info("%sSome bugs were reproduced.%s",
+                             GREEN + BOLD, ENDC)
+            self.logger.info(SEP_GREEN)
             for i, bug in enumerate(bugs_reproduced):
-                self.logger.info(f"{GREEN}{i+1}. {bug}{ENDC}")
-            self.logger.info(f"{GREEN}{BOLD}=============================="
-                             f"========================================{ENDC}")
-        return status
+                self.logger.info("%s%d. %s%s", GREEN, i + 1, bug, ENDC)
+            self.logger.info(SEP_GREEN)
+        return processed_any and not bugs_error
 
-    def triage_syzkaller_bugs(self, dry_run=False):
+    def triage_internal_syzkaller_bugs(self, dry_run=False):
         """
-        Triage Syzkaller bugs by reproducing them in a Linux kernel
-        environment.
+        Triage internal Syzkaller bugs by reproducing them in a Linux
+        kernel environment.
 
         Parameters:
         dry_run (bool): If True, simulates the entire triage process without
@@ -205,115 +281,51 @@ class SyzTriage(SyzDetails, SyzSetup, SyzReproduce, SyzInternal):
         bool: True if all bugs were triaged successfully or if dry_run is
               True and no actual triage is performed, False otherwise.
         """
-        bugs_reproduced = []
-        bugs_not_reproduced = []
-        bugs_error = []
-        status = False
-        log_file_name = f"syztriage-{int(time.time())}.log"
-        with open(log_file_name, "a+") as f:
-            for bug in BUGS_LIST:
-                self.logger.info(f"Processing bug: {bug}")
-                self.logger.info("Getting bug details.")
-                valid_crashes = self.get_bug_details(bug, dry_run=dry_run)
-                if not valid_crashes:
-                    self.logger.error(f"{RED}Getting bug details failed!"
-                                      f"{ENDC}")
-                    bugs_error.append(bug)
-                    continue
-                crash_dict = valid_crashes[0]
-                self.logger.info("Setting up Linux repository.")
-                if not self.setup_kernel_repository(crash_dict,
-                                                    LINUX_REPO_PATH,
-                                                    dry_run=dry_run):
-                    self.logger.error(f"{RED}Setting up Linux repository "
-                                      f"failed!{ENDC}")
-                    bugs_error.append(bug)
-                    continue
-                self.logger.info("Reproducing bug.")
-                status, cause = self.reproduce_issue(crash_dict,
-                                                     LINUX_REPO_PATH,
-                                                     dry_run=dry_run)
-                f.writelines("================================================"
-                             "===========================================\r\n")
-                f.writelines(f"{bug}\r\n")
-                f.writelines("================================================"
-                             "===========================================\r\n")
-                if self.vm_stdout:
-                    f.write(self.vm_stdout)
-
-                if status and cause == "Valid":
-                    bugs_reproduced.append(bug)
-                    continue
-                elif status and cause == "Dry run":
-                    bugs_not_reproduced.append(bug)
-                    continue
-                elif cause == "Err":
-                    self.logger.error(f"{RED}Error during bug reproduction!"
-                                      f"{ENDC}")
-                    bugs_error.append(bug)
-                elif cause == "Invalid":
-                    bugs_not_reproduced.append(bug)
-                    continue
-                else:
-                    self.logger.error(f"{RED}Error during bug reproduction!"
-                                      f"{ENDC}")
-                    bugs_error.append(bug)
+        self.logger.info("Getting internal bug details.")
+        valid_crashes = self.get_internal_bug_details(dry_run=dry_run)
+        if not valid_crashes:
+            self._err("Getting bug details failed!")
+            return False
+        crashes = [(crash_dict["task_name"], crash_dict)
+                   for crash_dict in valid_crashes]
+        return self._run_triage(crashes, dry_run=dry_run, internal=True)
 
-        if not bugs_error and not bugs_not_reproduced and not bugs_reproduced:
-            self.logger.error(f"{RED}{BOLD}=============================="
-                              f"====================================={ENDC}")
-            self.logger.error(f"{RED}No bugs were processed!{ENDC}")
-            self.logger.error(f"{RED}{BOLD}=============================="
-                              f"====================================={ENDC}")
-            return status
-
-        if not bugs_error:
-            status = True
-        else:
-            self.logger.error(f"{RED}{BOLD}=============================="
-                              f"====================================={ENDC}")
-            self.logger.error(f"{RED}{BOLD}Some errors happened"
-                              f" during reproduction of the bugs!{ENDC}")
-            self.logger.error(f"{RED}{BOLD}=============================="
-                              f"====================================={ENDC}")
-            for i, bug in enumerate(bugs_error):
-                self.logger.error(f"{RED}{BOLD}{i+1}. {bug}{ENDC}")
-            self.logger.error(f"{RED}{BOLD}=============================="
-                              f"====================================={ENDC}")
+    def triage_syzkaller_bugs(self, dry_run=False):
+        """
+        Triage Syzkaller bugs by reproducing them in a Linux kernel
+        environment.
 
-        if bugs_not_reproduced:
-            self.logger.info(f"{BLUE}{BOLD}=============================="
-                             f"======================================={ENDC}")
-            self.logger.info(f"{BLUE}{BOLD}Some bugs were not "
-                             f"reproduced.{ENDC}")
-            self.logger.info(f"{BLUE}{BOLD}=============================="
-                             f"======================================={ENDC}")
-            for i, bug in enumerate(bugs_not_reproduced):
-                self.logger.info(f"{BLUE}{i+1}. {bug}{ENDC}")
-            self.logger.info(f"{BLUE}{BOLD}=============================="
-                             f"======================================={ENDC}")
+        Parameters:
+        dry_run (bool): If True, simulates the entire triage process without
+                        making any changes (default is False).
 
-        if bugs_reproduced:
-            self.logger.info(f"{GREEN}{BOLD}=============================="
-                             f"========================================{ENDC}")
-            self.logger.info(f"{GREEN}{BOLD}Some bugs were reproduced.{ENDC}")
-            self.logger.info(f"{GREEN}{BOLD}=============================="
-                             f"========================================{ENDC}")
-            for i, bug in enumerate(bugs_reproduced):
-                self.logger.info(f"{GREEN}{i+1}. {bug}{ENDC}")
-            self.logger.info(f"{GREEN}{BOLD}=============================="
-                             f"========================================{ENDC}")
-        return status
+        Returns:
+        bool: True if all bugs were triaged successfully or if dry_run is
+              True and no actual triage is performed, False otherwise.
+        """
+        # Bug details are network-bound and independent, so they are
+        # prefetched concurrently up front; the VM reproduction stays
+        # serial because the QEMU/SSH ports are fixed and the booted VM
+        # is pooled across bugs
+        self.logger.info("Getting bug details.")
+        details = self.get_bug_details_batch(self.bugs_list, dry_run=dry_run,
+                                             workers=self.jobs)
+        crashes = [(bug, details[bug][0] if details.get(bug) else None)
+                   for bug in self.bugs_list]
+        return self._run_triage(crashes, dry_run=dry_run)
 
 
 if __name__ == "__main__":
     syz = SyzTriage()
-    if syz.internal_bugs:
-        status = syz.triage_internal_syzkaller_bugs(dry_run=syz.dry_run)
-    else:
-        status = syz.triage_syzkaller_bugs(dry_run=syz.dry_run)
+    try:
+        if syz.internal_bugs:
+            status = syz.triage_internal_syzkaller_bugs(dry_run=syz.dry_run)
+        else:
+            status = syz.triage_syzkaller_bugs(dry_run=syz.dry_run)
+    finally:
+        # The VM is pooled across reproductions; tear it down once here
+        syz.close()
+        # Flush and close the handlers even when triage raised
+        logging.shutdown()
 
-    if status:
-        exit(0)
-    else:
-        exit(1)
+    raise SystemExit(0 if status else 1)
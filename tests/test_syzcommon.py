@@ -6,15 +6,18 @@ import src.syzcommon as syzcommon
 TEST_REPO_URI = "https://github.com/Asiderr/syztriage.git"
 TEST_REPO_DIR = "syztriage"
 
+# Configure logging once for the module; per-test basicConfig calls
+# were no-ops after the first anyway
+logging.basicConfig(
+    level=logging.DEBUG,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
 
 class TestSyzCommon(unittest.TestCase):
     def setUp(self) -> None:
         self.syz = syzcommon.SyzCommon()
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format="%(asctime)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
         self.syz.clone_repository(TEST_REPO_URI)
         return super().setUp()
 
@@ -8,14 +8,16 @@ NO_REPRO_URL = "https://syzkaller.appspot.com/bug?extid=fc5141fdfb1e59951d38"
 VALID_URL = "https://syzkaller.appspot.com/bug?extid=aeb14e2539ffb6d21130"
 
 
+logging.basicConfig(
+    level=logging.DEBUG,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+
 class TestSyzDetails(unittest.TestCase):
     def setUp(self) -> None:
         self.syz = syzdetails.SyzDetails()
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format="%(asctime)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
         return super().setUp()
 
     def test_fetch_bug_report_invalid_url(self):
@@ -40,26 +42,17 @@ class TestSyzDetails(unittest.TestCase):
     def test_fetch_bug_report_dry_run(self):
         self.assertIsNone(self.syz._fetch_bug_report(VALID_URL, dry_run=True))
 
-    def test_find_crashes_invalid_html(self):
+    def test_extract_crashes_invalid_html(self):
         bug_html = "Invalid"
-        self.assertIsNone(self.syz._find_crashes(bug_html))
+        self.assertIsNone(self.syz._extract_crashes(bug_html))
 
-    def test_find_crashes_valid_html(self):
-        bug_html = self.syz._fetch_bug_report(VALID_URL)
-        crash_table = self.syz._find_crashes(bug_html)
-        self.assertEqual("45db3ab70092", crash_table["Commit"][0][0])
-
-    def test_analyze_crashes_no_repro(self):
+    def test_extract_crashes_no_repro(self):
         bug_html = self.syz._fetch_bug_report(NO_REPRO_URL)
-        crash_table = self.syz._find_crashes(bug_html)
-        self.assertFalse(self.syz._analyze_crashes(crash_table))
+        self.assertFalse(self.syz._extract_crashes(bug_html))
 
-    def test_analyze_crashes_existing_repro(self):
-        bug_html = self.syz._fetch_bug_report(
-            VALID_URL
-        )
-        crash_table = self.syz._find_crashes(bug_html)
-        valid_crashes = self.syz._analyze_crashes(crash_table)
+    def test_extract_crashes_existing_repro(self):
+        bug_html = self.syz._fetch_bug_report(VALID_URL)
+        valid_crashes = self.syz._extract_crashes(bug_html)
         self.assertTrue(valid_crashes)
         self.assertEqual("45db3ab70092", valid_crashes[0]["commit"])
 
@@ -17,14 +17,16 @@ TEST_CRASH_DETAILS = {
 }
 
 
+logging.basicConfig(
+    level=logging.DEBUG,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+
 class TestSyzSetup(unittest.TestCase):
     def setUp(self) -> None:
         self.syz = syzsetup.SyzSetup()
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format="%(asctime)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
         self.syz.clone_repository(TEST_REPO_URI)
         return super().setUp()
 
@@ -45,15 +47,18 @@ class TestSyzSetup(unittest.TestCase):
         )
 
     def test_check_kernel_remote_valid_remote(self):
+        # auto_fetch=False: the tests only probe the remote config and
+        # must not pull the whole stable tree into the throwaway clone
         self.syz.add_repository_remote(TEST_REPO_DIR, syzsetup.LTS_REMOTE,
-                                       "lts")
+                                       "lts", auto_fetch=False)
         self.assertTrue(self.syz._check_kernel_remote(TEST_REPO_DIR,
                                                       syzsetup.LTS_REMOTE))
         self.assertEqual(self.syz.remote_name, "lts")
 
     def test_check_kernel_remote_non_existing_remote(self):
         self.assertTrue(self.syz._check_kernel_remote(TEST_REPO_DIR,
-                                                      syzsetup.LTS_REMOTE))
+                                                      syzsetup.LTS_REMOTE,
+                                                      auto_fetch=False))
         self.assertEqual(self.syz.remote_name, "stable/linux")
 
     def test_setup_kernel_config_dry_run(self):